@@ -4,13 +4,104 @@ Auto Deployment Tool
 A simplified implementation
 """
 
+import io
 import os
 import re
 import json
-import requests
-import zipfile
-import tempfile
+import mmap
+import time
+import hashlib
+import shutil
+import sys
 from dataclasses import dataclass
+from functools import lru_cache, partial
+from string import Template
+
+# Port literal near a "port" keyword, compiled once and matched against raw bytes.
+# google-re2 guarantees linear-time matching on minified sources when it's
+# installed; other "re2" bindings differ on bytes patterns, so fall back to re
+# if the pattern doesn't compile and match there.
+_PORT_PATTERN = rb'(?i)port\D{0,10}(\d{4})'
+try:
+    import re2 as _port_re_engine
+    _PORT_RE = _port_re_engine.compile(_PORT_PATTERN)
+    if _PORT_RE.search(b"PORT = 8080").group(1) != b"8080":
+        raise ValueError("re2 binding mishandles bytes patterns")
+except Exception:
+    _port_re_engine = re
+    _PORT_RE = re.compile(_PORT_PATTERN)
+
+# Limits for the repository scan
+_SKIP_DIRS = {".git", "node_modules", "venv", "__pycache__"}
+_MAX_SCAN_DEPTH = 3
+_MAX_SCAN_FILES = 50
+_SCAN_BYTES = 64 * 1024
+_MAX_FILE_SIZE = 1000 * 1000
+
+# Buffer size for downloading repository archives
+_CHUNK_SIZE = 1024 * 1024
+
+# On-disk cache of repository analysis results
+_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "simple-auto-deploy")
+_CACHE_TTL = 24 * 60 * 60  # seconds
+
+# Description keywords mapped to the config field and value they imply
+_KEYWORDS = {
+    b"flask": ("type", "flask"),
+    b"node": ("type", "nodejs"),
+    b"javascript": ("type", "nodejs"),
+    b"django": ("type", "django"),
+    b"gcp": ("cloud", "gcp"),
+    b"google": ("cloud", "gcp"),
+    b"azure": ("cloud", "azure"),
+    b"microsoft": ("cloud", "azure"),
+}
+
+# One keyword scanner shared by description parsing and requirements.txt
+# scanning. Hyperscan matches every keyword in a single pass when installed;
+# its database is compiled on first use so startup doesn't pay for it.
+_KEYWORD_LIST = sorted(_KEYWORDS, key=len, reverse=True)
+# Lookahead so overlapping keywords are reported, as Hyperscan does
+_KEYWORD_RE = re.compile(b"(?=(" + b"|".join(_KEYWORD_LIST) + b"))", re.IGNORECASE)
+_keyword_db = None  # hyperscan.Database once built, False if unavailable
+
+def _get_keyword_db():
+    """Build the Hyperscan keyword database on first call"""
+    global _keyword_db
+    if _keyword_db is None:
+        try:
+            import hyperscan
+            db = hyperscan.Database()
+            db.compile(
+                expressions=[re.escape(k) for k in _KEYWORD_LIST],
+                ids=list(range(len(_KEYWORD_LIST))),
+                elements=len(_KEYWORD_LIST),
+                flags=hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_SINGLEMATCH,
+            )
+            _keyword_db = db
+        except Exception:
+            _keyword_db = False
+    return _keyword_db
+
+def _find_keywords(data):
+    """Return the set of _KEYWORDS (lowercase bytes) that occur in data"""
+    db = _get_keyword_db()
+    if not db:
+        return {match.lower() for match in _KEYWORD_RE.findall(data)}
+    
+    found = set()
+    
+    def on_match(keyword_id, start, end, flags, context):
+        found.add(_KEYWORD_LIST[keyword_id])
+    
+    db.scan(data, match_event_handler=on_match)
+    return found
+
+# Words never used as the app name, and how far into the text to look for one
+_STOPWORDS = frozenset({
+    "deploy", "this", "application", "using", "with", "on", "my", "the", "a", "app",
+})
+_MAX_NAME_WORDS = 32
 
 @dataclass
 class AppConfig:
@@ -27,28 +118,31 @@ class SimpleNLP:
         """Parse user input"""
         text = text.lower()
         
-        # Simple keyword matching
+        # Single pass over the text collecting every keyword hit
+        hits = {}
+        for keyword in _find_keywords(text.encode('utf-8')):
+            field, value = _KEYWORDS[keyword]
+            hits.setdefault(field, set()).add(value)
+        
+        # Simple keyword matching, in priority order
         app_type = "python"  # default
-        if "flask" in text:
-            app_type = "flask"
-        elif "node" in text or "javascript" in text:
-            app_type = "nodejs"
-        elif "django" in text:
-            app_type = "django"
+        for candidate in ("flask", "nodejs", "django"):
+            if candidate in hits.get("type", ()):
+                app_type = candidate
+                break
         
         # Detect cloud provider
         cloud = "aws"
-        if "gcp" in text or "google" in text:
-            cloud = "gcp"
-        elif "azure" in text or "microsoft" in text:
-            cloud = "azure"
+        for candidate in ("gcp", "azure"):
+            if candidate in hits.get("cloud", ()):
+                cloud = candidate
+                break
         
         # Extract app name (simple version)
-        words = text.split()
         name = "my-app"
-        for word in words:
-            if len(word) > 3 and word not in ["deploy", "this", "application", "using"]:
-                name = word.replace(" ", "-")
+        for word in text.split(maxsplit=_MAX_NAME_WORDS)[:_MAX_NAME_WORDS]:
+            if len(word) > 3 and word not in _STOPWORDS:
+                name = word
                 break
         
         return AppConfig(name=name, type=app_type, cloud=cloud)
@@ -56,6 +150,12 @@ class SimpleNLP:
 class RepoAnalyzer:
     """Code repository analyzer - basic version"""
     
+    def __init__(self, cache_dir=_CACHE_DIR):
+        # Results already analyzed by this instance, keyed by archive URL
+        self._results = {}
+        self.cache_dir = cache_dir
+        self._session = None
+    
     def analyze_repo(self, url):
         """Analyze repository content"""
         if not url:
@@ -69,161 +169,279 @@ class RepoAnalyzer:
             if "github.com" in url and not url.endswith(".zip"):
                 url = url + "/archive/main.zip"
             
-            # Download file
-            response = requests.get(url, timeout=10)
+            # Reuse an earlier analysis of the same URL
+            if url in self._results:
+                return dict(self._results[url])
             
-            with tempfile.TemporaryDirectory() as temp_dir:
-                zip_path = os.path.join(temp_dir, "repo.zip")
-                with open(zip_path, "wb") as f:
-                    f.write(response.content)
-                
-                # Extract and analyze
-                with zipfile.ZipFile(zip_path) as zip_file:
-                    zip_file.extractall(temp_dir)
-                
-                # Find project files
-                return self._analyze_files(temp_dir)
+            cached = self._load_cached(url)
+            if cached and cached["fresh"]:
+                result = {"type": cached["type"], "port": cached["port"]}
+                self._results[url] = result
+                return dict(result)
+            
+            # Revalidate an expired entry instead of downloading it again
+            headers = {}
+            if cached and cached.get("etag"):
+                headers["If-None-Match"] = cached["etag"]
+            if cached and cached.get("last_modified"):
+                headers["If-Modified-Since"] = cached["last_modified"]
+            
+            if self._session is None:
+                # Imported here so startup and offline paths don't pay for it
+                import requests
+                self._session = requests.Session()
+            
+            with self._session.get(url, timeout=10, stream=True, headers=headers) as response:
+                if response.status_code == 304 and cached:
+                    result = {"type": cached["type"], "port": cached["port"]}
+                else:
+                    response.raise_for_status()
+                    result = self._analyze_response(response)
+                validators = {
+                    "etag": response.headers.get("ETag") or (cached or {}).get("etag"),
+                    "last_modified": (response.headers.get("Last-Modified")
+                                      or (cached or {}).get("last_modified")),
+                }
+            
+            self._results[url] = result
+            self._save_cached(url, result, validators)
+            return dict(result)
                 
         except Exception as e:
             print(f"Repository analysis failed: {e}")
             return {"type": "unknown", "port": 5000}
     
-    def _analyze_files(self, directory):
-        """Analyze file content - simple implementation"""
-        app_type = "python"
-        port = 5000
+    def _analyze_response(self, response):
+        """Download a repository archive and analyze it"""
+        import tempfile
+        import zipfile
         
-        # Walk through files looking for clues
+        with tempfile.TemporaryFile() as archive:
+            # Stream the download straight to disk in 1 MiB chunks
+            response.raw.decode_content = True
+            shutil.copyfileobj(response.raw, archive, length=_CHUNK_SIZE)
+            
+            # Read project files straight out of the archive
+            archive.seek(0)
+            with zipfile.ZipFile(archive) as zip_file:
+                return self._analyze_zip(zip_file)
+    
+    def _cache_path(self, url):
+        """Location of the on-disk cache entry for a URL"""
+        key = hashlib.sha1(url.encode('utf-8')).hexdigest()
+        return os.path.join(self.cache_dir, f"{key}.json")
+    
+    def _load_cached(self, url):
+        """Load a cached analysis entry, flagging whether it is still fresh"""
+        path = self._cache_path(url)
+        try:
+            fresh = time.time() - os.path.getmtime(path) <= _CACHE_TTL
+            with open(path, 'r', encoding='utf-8') as f:
+                cached = json.load(f)
+            return {
+                "type": cached["type"],
+                "port": cached["port"],
+                "etag": cached.get("etag"),
+                "last_modified": cached.get("last_modified"),
+                "fresh": fresh,
+            }
+        except (OSError, ValueError, KeyError, TypeError, AttributeError):
+            return None
+    
+    def _save_cached(self, url, result, validators=None):
+        """Persist an analysis result; the cache is best effort"""
+        entry = {"type": result["type"], "port": result["port"]}
+        entry.update(validators or {})
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            with open(self._cache_path(url), 'w', encoding='utf-8') as f:
+                json.dump(entry, f)
+        except OSError:
+            pass
+    
+    def _analyze_zip(self, zip_file):
+        """Analyze an archive in place, without extracting it"""
+        return self._scan(self._zip_entries(zip_file))
+    
+    def _analyze_files(self, directory):
+        """Analyze a checked-out directory"""
+        return self._scan(self._directory_entries(directory))
+    
+    def _zip_entries(self, zip_file):
+        """Yield (filename, reader) pairs for archive members worth scanning"""
+        for info in zip_file.infolist():
+            if info.is_dir():
+                continue
+            parts = info.filename.split("/")
+            # Depth is counted below the archive's single <repo>-<branch>/ folder
+            if len(parts) - 2 > _MAX_SCAN_DEPTH or _SKIP_DIRS.intersection(parts[:-1]):
+                continue
+            yield parts[-1], partial(self._read_member, zip_file, info)
+    
+    def _directory_entries(self, directory):
+        """Yield (filename, reader) pairs for files worth scanning"""
         for root, dirs, files in os.walk(directory):
+            # Skip vendored / generated directories
+            dirs[:] = [d for d in dirs if d not in _SKIP_DIRS]
+            
+            depth = root[len(directory):].count(os.sep)
+            if depth > _MAX_SCAN_DEPTH:
+                dirs[:] = []
+                continue
+            
             for file in files:
-                # Check Python project
-                if file == "requirements.txt":
-                    file_path = os.path.join(root, file)
-                    try:
-                        with open(file_path, 'r') as f:
-                            content = f.read().lower()
-                            if "flask" in content:
-                                app_type = "flask"
-                                port = 5000
-                            elif "django" in content:
-                                app_type = "django"
-                                port = 8000
-                    except:
-                        pass
-                
-                # Check Node.js project
-                elif file == "package.json":
-                    app_type = "nodejs"
-                    port = 3000
-                
-                # Check port configuration
-                elif file.endswith(('.py', '.js')):
-                    file_path = os.path.join(root, file)
-                    try:
-                        with open(file_path, 'r') as f:
-                            content = f.read()
-                            # Simple port matching
-                            port_match = re.search(r'port.*?(\d{4})', content, re.IGNORECASE)
-                            if port_match:
-                                port = int(port_match.group(1))
-                    except:
-                        pass
+                yield file, partial(self._read_local, os.path.join(root, file))
+    
+    def _read_member(self, zip_file, info, limit=-1):
+        """Read up to limit bytes of an archive member"""
+        with zip_file.open(info) as f:
+            return f.read(limit)
+    
+    def _read_local(self, path, limit=-1):
+        """Read up to limit bytes of a local file through mmap; large files are skipped"""
+        with open(path, 'rb') as f:
+            size = os.fstat(f.fileno()).st_size
+            # Config lives in small files; bundles aren't worth mapping
+            if size == 0 or size > _MAX_FILE_SIZE:
+                return b""
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                return mm[:limit] if limit >= 0 else mm[:]
+    
+    def _scan(self, entries):
+        """Look for framework and port clues - bounded scan of the top of the tree"""
+        app_type = "python"
+        default_port = 5000
+        port = None
+        framework_found = False
+        scanned = 0
         
-        return {"type": app_type, "port": port}
+        for file, read in entries:
+            # Check Python project; only a framework match settles it, since
+            # archives list docs/requirements.txt before the root one
+            if file == "requirements.txt" and not framework_found:
+                try:
+                    keywords = _find_keywords(read())
+                    if b"flask" in keywords:
+                        app_type = "flask"
+                        default_port = 5000
+                        framework_found = True
+                    elif b"django" in keywords:
+                        app_type = "django"
+                        default_port = 8000
+                        framework_found = True
+                except:
+                    pass
+            
+            # Check Node.js project
+            elif file == "package.json" and not framework_found:
+                app_type = "nodejs"
+                default_port = 3000
+                framework_found = True
+            
+            # Check port configuration
+            elif (file.endswith(('.py', '.js')) and port is None
+                    and scanned < _MAX_SCAN_FILES):
+                scanned += 1
+                try:
+                    # Port settings live near the top of the file
+                    port_match = _PORT_RE.search(read(_SCAN_BYTES))
+                    if port_match:
+                        port = int(port_match.group(1))
+                except:
+                    pass
+            
+            if framework_found and (port is not None or scanned >= _MAX_SCAN_FILES):
+                break
+        
+        return {"type": app_type, "port": port if port is not None else default_port}
 
-class ConfigGenerator:
-    """Configuration file generator - basic templates"""
-    
-    def generate_docker(self, config):
-        """Generate simple Dockerfile"""
-        if config.type == "flask":
-            return f"""FROM python:3.9
+# Configuration file templates, parsed once at import time
+_DOCKERFILES = {
+    "flask": Template("""FROM python:3.9
 WORKDIR /app
 COPY requirements.txt .
 RUN pip install -r requirements.txt
 COPY . .
-EXPOSE {config.port}
-CMD ["python", "app.py"]"""
-        
-        elif config.type == "django":
-            return f"""FROM python:3.9
+EXPOSE $port
+CMD ["python", "app.py"]"""),
+    
+    "django": Template("""FROM python:3.9
 WORKDIR /app
 COPY requirements.txt .
 RUN pip install -r requirements.txt
 COPY . .
 RUN python manage.py collectstatic --noinput
-EXPOSE {config.port}
-CMD ["python", "manage.py", "runserver", "0.0.0.0:{config.port}"]"""
-        
-        elif config.type == "nodejs":
-            return f"""FROM node:16
+EXPOSE $port
+CMD ["python", "manage.py", "runserver", "0.0.0.0:$port"]"""),
+    
+    "nodejs": Template("""FROM node:16
 WORKDIR /app
 COPY package*.json ./
 RUN npm install
 COPY . .
-EXPOSE {config.port}
-CMD ["npm", "start"]"""
-        
-        else:
-            return f"""FROM python:3.9
+EXPOSE $port
+CMD ["npm", "start"]"""),
+    
+    "python": Template("""FROM python:3.9
 WORKDIR /app
 COPY . .
-EXPOSE {config.port}
-CMD ["python", "app.py"]"""
-    
-    def generate_terraform(self, config):
-        """Generate basic Terraform configuration"""
-        # Simplified AWS ECS configuration
-        return f"""# Basic AWS deployment configuration
-terraform {{
-  required_providers {{
-    aws = {{
+EXPOSE $port
+CMD ["python", "app.py"]"""),
+}
+
+# Simplified AWS ECS configuration; only the middle section is formatted per call
+_TERRAFORM_PREFIX = """# Basic AWS deployment configuration
+terraform {
+  required_providers {
+    aws = {
       source  = "hashicorp/aws"
       version = "~> 5.0"
-    }}
-  }}
-}}
+    }
+  }
+}
 
-provider "aws" {{
+provider "aws" {
   region = "us-west-2"
-}}
+}
 
 # Simple ECS cluster
-resource "aws_ecs_cluster" "app" {{
-  name = "{config.name}-cluster"
-}}
+resource "aws_ecs_cluster" "app" {
+"""
+
+_TERRAFORM_BODY = Template("""  name = "$name-cluster"
+}
 
 # Container definition
-resource "aws_ecs_task_definition" "app" {{
-  family                   = "{config.name}"
+resource "aws_ecs_task_definition" "app" {
+  family                   = "$name"
   requires_compatibilities = ["FARGATE"]
   network_mode            = "awsvpc"
   cpu                     = 256
   memory                  = 512
   
-  container_definitions = jsonencode([{{
-    name  = "{config.name}"
-    image = "{config.name}:latest"
+  container_definitions = jsonencode([{
+    name  = "$name"
+    image = "$name:latest"
     
-    portMappings = [{{
-      containerPort = {config.port}
-      hostPort      = {config.port}
-    }}]
-  }}])
-}}
-
+    portMappings = [{
+      containerPort = $port
+      hostPort      = $port
+    }]
+  }])
+}
+""")
+
+_TERRAFORM_SUFFIX = """
 # Output information
-output "cluster_name" {{
+output "cluster_name" {
   description = "ECS cluster name"
   value = aws_ecs_cluster.app.name
-}}"""
+}"""
 
-    def generate_deploy_script(self, config):
-        """Generate simple deployment script"""
-        return f"""#!/bin/bash
+_DEPLOY_SCRIPT = Template("""#!/bin/bash
 # Simple deployment script
 
-echo "Starting deployment of {config.name}..."
+echo "Starting deployment of $name..."
 
 # Check environment
 if ! command -v docker &> /dev/null; then
@@ -238,7 +456,7 @@ fi
 
 # Build image
 echo "Building Docker image..."
-docker build -t {config.name}:latest .
+docker build -t $name:latest .
 
 # Initialize Terraform
 echo "Initializing Terraform..."
@@ -250,24 +468,65 @@ terraform plan
 terraform apply -auto-approve
 
 echo "Deployment complete!"
-"""
+""")
 
-    def generate_docker_compose(self, config):
-        """Generate docker-compose for local development"""
-        return f"""version: '3.8'
+_DOCKER_COMPOSE = Template("""version: '3.8'
 
 services:
-  {config.name}:
+  $name:
     build: .
     ports:
-      - "{config.port}:{config.port}"
+      - "$port:$port"
     environment:
       - NODE_ENV=development
       - FLASK_ENV=development
     volumes:
       - .:/app
     restart: unless-stopped
-"""
+""")
+
+class ConfigGenerator:
+    """Configuration file generator - basic templates"""
+    
+    def generate_docker(self, config):
+        """Generate simple Dockerfile"""
+        return self._render_docker(config.type, config.port)
+    
+    def generate_terraform(self, config):
+        """Generate basic Terraform configuration"""
+        return self._render_terraform(config.name, config.port)
+
+    def generate_deploy_script(self, config):
+        """Generate simple deployment script"""
+        return self._render_deploy_script(config.name)
+
+    def generate_docker_compose(self, config):
+        """Generate docker-compose for local development"""
+        return self._render_docker_compose(config.name, config.port)
+    
+    # Output is a pure function of these fields, so renders are memoized
+    
+    @staticmethod
+    @lru_cache(maxsize=64)
+    def _render_docker(app_type, port):
+        template = _DOCKERFILES.get(app_type, _DOCKERFILES["python"])
+        return template.substitute(port=port)
+    
+    @staticmethod
+    @lru_cache(maxsize=64)
+    def _render_terraform(name, port):
+        body = _TERRAFORM_BODY.substitute(name=name, port=port)
+        return _TERRAFORM_PREFIX + body + _TERRAFORM_SUFFIX
+    
+    @staticmethod
+    @lru_cache(maxsize=64)
+    def _render_deploy_script(name):
+        return _DEPLOY_SCRIPT.substitute(name=name)
+    
+    @staticmethod
+    @lru_cache(maxsize=64)
+    def _render_docker_compose(name, port):
+        return _DOCKER_COMPOSE.substitute(name=name, port=port)
 
 class AutoDeployTool:
     """Main auto deployment tool class"""
@@ -309,22 +568,11 @@ class AutoDeployTool:
             "success": True
         }
     
-    def save_files(self, result):
-        """Save generated files"""
+    def save_files(self, result, as_tar=False):
+        """Save generated files, optionally bundled into a single tar archive"""
         config = result["config"]
         output_dir = f"deployment_{config.name}"
         
-        os.makedirs(output_dir, exist_ok=True)
-        
-        for filename, content in result["files"].items():
-            filepath = os.path.join(output_dir, filename)
-            with open(filepath, 'w', encoding='utf-8') as f:
-                f.write(content)
-            
-            # Give shell scripts execute permission
-            if filename.endswith('.sh'):
-                os.chmod(filepath, 0o755)
-        
         # Generate simple README
         readme = f"""# {config.name.title()} Deployment Configuration
 
@@ -362,11 +610,84 @@ docker-compose up
 Generated by: Auto Deployment Tool
 """
         
-        with open(os.path.join(output_dir, "README.md"), 'w', encoding='utf-8') as f:
-            f.write(readme)
+        files = dict(result["files"])
+        files["README.md"] = readme
+        
+        # Encode once; shell scripts are flagged for execute permission
+        entries = [
+            (filename, content.encode('utf-8'), filename.endswith('.sh'))
+            for filename, content in files.items()
+        ]
+        
+        if as_tar:
+            archive_path = f"{output_dir}.tar"
+            self._write_file(archive_path, self._build_tar(output_dir, entries))
+            print(f"Files saved to: {archive_path}")
+            return archive_path
+        
+        # Imported here; concurrent.futures pulls in logging at startup
+        from concurrent.futures import ThreadPoolExecutor
+        
+        os.makedirs(output_dir, exist_ok=True)
+        
+        # Each file is independent, so overlap the writes
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            list(executor.map(
+                lambda entry: self._write_file(os.path.join(output_dir, entry[0]), *entry[1:]),
+                entries,
+            ))
         
         print(f"Files saved to: {output_dir}/")
         return output_dir
+    
+    def _build_tar(self, output_dir, entries):
+        """Bundle (filename, data, executable) entries under output_dir/ in an in-memory tar"""
+        import tarfile
+        
+        buffer = io.BytesIO()
+        now = int(time.time())
+        with tarfile.open(fileobj=buffer, mode='w') as tar:
+            for filename, data, executable in entries:
+                info = tarfile.TarInfo(f"{output_dir}/{filename}")
+                info.size = len(data)
+                info.mode = 0o755 if executable else 0o644
+                info.mtime = now
+                tar.addfile(info, io.BytesIO(data))
+        return buffer.getvalue()
+    
+    def _write_file(self, path, data, executable=False):
+        """Write bytes to path with a single os.write pass"""
+        # Leave identical files alone so their mtime doesn't trigger rebuilds
+        if self._unchanged(path, data, executable):
+            return
+        
+        # O_BINARY keeps Windows from translating newlines in text and tar data
+        flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+        fd = os.open(path, flags, 0o666)
+        try:
+            view = memoryview(data)
+            while view:
+                view = view[os.write(fd, view):]
+        finally:
+            os.close(fd)
+        
+        # Give shell scripts execute permission
+        if executable:
+            os.chmod(path, 0o755)
+    
+    def _unchanged(self, path, data, executable):
+        """Check whether path already holds exactly data (and is executable if it should be)"""
+        try:
+            stat = os.stat(path)
+            if stat.st_size != len(data):
+                return False
+            # Only POSIX has an execute bit worth checking
+            if executable and os.name == "posix" and not stat.st_mode & 0o100:
+                return False
+            with open(path, 'rb') as f:
+                return f.read() == data
+        except OSError:
+            return False
 
 def main():
     """Main function - simple command line interface"""
@@ -479,18 +800,87 @@ def test_basic_functionality():
     assert "port" in repo_info
     print("Test 3 passed: Repository analysis")
     
+    # Test 4: Archive analysis, read in place from an in-memory zip
+    import zipfile
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w") as zip_file:
+        zip_file.writestr("repo-main/docs/requirements.txt", "sphinx\n")
+        zip_file.writestr("repo-main/requirements.txt", "Flask==2.0\n")
+        zip_file.writestr("repo-main/a/b/c/app.py", "app.run(port=8123)\n")
+    with zipfile.ZipFile(buffer) as zip_file:
+        repo_info = analyzer._analyze_zip(zip_file)
+    assert repo_info == {"type": "flask", "port": 8123}
+    print("Test 4 passed: Archive analysis")
+    
+    # Test 5: Analysis results are cached on disk and reused without a download
+    import tempfile
+    with tempfile.TemporaryDirectory() as cache_dir:
+        url = "https://example.com/repo.zip"
+        RepoAnalyzer(cache_dir)._save_cached(url, {"type": "django", "port": 8000})
+        cached_analyzer = RepoAnalyzer(cache_dir)
+        assert cached_analyzer.analyze_repo(url) == {"type": "django", "port": 8000}
+        assert cached_analyzer._session is None
+        
+        # An expired entry is revalidated with its ETag; a 304 reuses it
+        class NotModified:
+            status_code = 304
+            headers = {}
+            def __enter__(self):
+                return self
+            def __exit__(self, *exc):
+                return False
+        
+        class RecordingSession:
+            def get(self, url, **kwargs):
+                self.headers = kwargs["headers"]
+                return NotModified()
+        
+        stale_analyzer = RepoAnalyzer(cache_dir)
+        stale_analyzer._save_cached(url, {"type": "flask", "port": 5000}, {"etag": '"v1"'})
+        os.utime(stale_analyzer._cache_path(url), (0, 0))
+        stale_analyzer._session = RecordingSession()
+        assert stale_analyzer.analyze_repo(url) == {"type": "flask", "port": 5000}
+        assert stale_analyzer._session.headers["If-None-Match"] == '"v1"'
+        assert stale_analyzer._load_cached(url)["fresh"]
+    print("Test 5 passed: Analysis cache")
+    
+    # Test 6: Bundled tar output keeps contents and the script's mode
+    import tarfile
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as work_dir:
+        os.chdir(work_dir)
+        try:
+            archive_path = tool.save_files(result, as_tar=True)
+            with tarfile.open(archive_path) as tar:
+                modes = {member.name: member.mode for member in tar.getmembers()}
+                main_tf = tar.extractfile("deployment_flask/main.tf").read()
+        finally:
+            os.chdir(cwd)
+    expected = {f"deployment_flask/{name}" for name in list(result["files"]) + ["README.md"]}
+    assert set(modes) == expected
+    assert modes["deployment_flask/deploy.sh"] == 0o755
+    assert main_tf == result["files"]["main.tf"].encode('utf-8')
+    print("Test 6 passed: Tar output")
+    
+    # Test 7: Re-saving identical output leaves files untouched
+    with tempfile.TemporaryDirectory() as work_dir:
+        os.chdir(work_dir)
+        try:
+            output_dir = tool.save_files(result)
+            paths = [os.path.join(output_dir, name) for name in os.listdir(output_dir)]
+            mtimes = {path: os.stat(path).st_mtime_ns for path in paths}
+            time.sleep(0.01)
+            tool.save_files(result)
+            assert mtimes == {path: os.stat(path).st_mtime_ns for path in paths}
+            if os.name == "posix":
+                assert os.stat(os.path.join(output_dir, "deploy.sh")).st_mode & 0o777 == 0o755
+        finally:
+            os.chdir(cwd)
+    print("Test 7 passed: Unchanged files skipped")
+    
     print("All basic tests passed!")
 
-if __name__ == "__main__":
-    import sys
-    
-    if len(sys.argv) > 1:
-        if sys.argv[1] == "--demo":
-            demo()
-        elif sys.argv[1] == "--test":
-            test_basic_functionality()
-        elif sys.argv[1] == "--help":
-            print("""
+_HELP = """
 Auto Deployment Tool - Usage:
 
 Interactive mode:
@@ -508,50 +898,19 @@ Test mode:
 Examples:
     python auto_deploy.py "Deploy my Flask app on AWS"
     python auto_deploy.py "Deploy Node.js API" https://github.com/user/repo
-            """)
-        else:
-            # Command line mode with arguments
-            desc = sys.argv[1]
-            repo = sys.argv[2] if len(sys.argv) > 2 else None
-            
-            tool = AutoDeployTool()
-            result = tool.process(desc, repo)
-            
-            if result["success"]:
-                tool.save_files(result)
-                print("Configuration generated successfully!")
-            else:
-                print("Processing failed")
-    else:
-        # Interactive mode
-        main()
-    import sys
+            """
+
+if __name__ == "__main__":
+    # Answer --help before doing any other work
+    if len(sys.argv) > 1 and sys.argv[1] == "--help":
+        print(_HELP)
+        sys.exit(0)
     
     if len(sys.argv) > 1:
         if sys.argv[1] == "--demo":
             demo()
         elif sys.argv[1] == "--test":
             test_basic_functionality()
-        elif sys.argv[1] == "--help":
-            print("""
-Auto Deployment Tool - Usage:
-
-Interactive mode:
-    python auto_deploy.py
-
-Command line mode:
-    python auto_deploy.py "Deploy Flask app" [repo_url]
-
-Demo mode:
-    python auto_deploy.py --demo
-
-Test mode:
-    python auto_deploy.py --test
-
-Examples:
-    python auto_deploy.py "Deploy my Flask app on AWS"
-    python auto_deploy.py "Deploy Node.js API" https://github.com/user/repo
-            """)
         else:
             # Command line mode with arguments
             desc = sys.argv[1]
@@ -562,9 +921,9 @@ Examples:
             
             if result["success"]:
                 tool.save_files(result)
-                print("✅ Configuration generated successfully!")
+                print("Configuration generated successfully!")
             else:
-                print("❌ Processing failed")
+                print("Processing failed")
     else:
         # Interactive mode
         main()